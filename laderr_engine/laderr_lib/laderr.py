@@ -151,7 +151,8 @@ class Laderr:
         return laderr_graph
 
     @staticmethod
-    def save_graph(laderr_graph: Graph, output_file_path: str, verbose: bool = True) -> None:
+    def save_graph(laderr_graph: Graph, output_file_path: str, verbose: bool = True,
+                   output_format: str = "turtle") -> None:
         """
         Saves an RDF graph to a specified file.
 
@@ -161,13 +162,17 @@ class Laderr:
         :type output_file_path: str
         :param verbose: Whether to log success messages.
         :type verbose: bool
+        :param output_format: RDF serialization format. Use "nt" for intermediate files that do not need to be
+                              human-readable, as it avoids Turtle's prefix resolution.
+        :type output_format: str
         """
-        GraphHandler.save_graph(laderr_graph, output_file_path)
+        GraphHandler.save_graph(laderr_graph, output_file_path, output_format)
         if verbose:
             logger.success(f"Graph successfully saved to: {output_file_path}")
 
     @staticmethod
-    def save_visualization_from_graph(laderr_graph: Graph, output_file_path: str, verbose: bool = False) -> None:
+    def save_visualization_from_graph(laderr_graph: Graph, output_file_path: str, verbose: bool = False,
+                                      output_format: str = "png", cache_dir: Optional[str] = None) -> None:
         """
         Generates a visualization from an RDF graph and saves it to a file.
 
@@ -177,8 +182,13 @@ class Laderr:
         :type output_file_path: str
         :param verbose: Whether to log messages.
         :type verbose: bool
+        :param output_format: Graphviz output format (e.g., 'png' or 'svg').
+        :type output_format: str
+        :param cache_dir: Directory in which renderings are cached and reused. Caching is disabled by default.
+        :type cache_dir: Optional[str]
         """
-        VisualizationCreator.create_graph_visualization(laderr_graph, output_file_path)
+        VisualizationCreator.create_graph_visualization(laderr_graph, output_file_path, output_format=output_format,
+                                                        cache_dir=cache_dir)
         if verbose:
             logger.success(f"Visualization successfully saved to {output_file_path}")
 
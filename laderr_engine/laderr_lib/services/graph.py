@@ -3,6 +3,7 @@ Module for handling RDF laderr_graph operations in the LaDeRR framework.
 
 This module provides functionalities for loading RDF schemas and saving RDF graphs in various formats.
 """
+import functools
 import os
 from collections import defaultdict
 
@@ -70,7 +71,7 @@ class GraphHandler:
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
             # Serialize and save the laderr_graph
-            graph.serialize(destination=file_path, format=format)
+            graph.serialize(destination=file_path, format=format, encoding="utf-8")
         except ValueError as e:
             raise ValueError(f"Serialization format '{format}' is not supported.") from e
         except OSError as e:
@@ -247,15 +248,25 @@ class GraphHandler:
 
         return graph, data_ns
 
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_laderr_schema_triples() -> tuple:
+        """
+        Returns the triples of the LaDeRR vocabulary, parsing the vocabulary file only on the first call.
+
+        :return: The triples of the LaDeRR vocabulary.
+        :rtype: tuple
+        """
+        return tuple(GraphHandler._load_laderr_schema())
+
     @staticmethod
     def _create_combined_graph(laderr_graph: Graph) -> Graph:
 
         combined_graph = Graph()
 
-        schema_graph = GraphHandler._load_laderr_schema()
-
-        combined_graph += schema_graph
-        combined_graph += laderr_graph
+        # Both parts are added with bulk store calls; the vocabulary is parsed once per process, not once per call
+        combined_graph.addN((s, p, o, combined_graph) for s, p, o in GraphHandler._get_laderr_schema_triples())
+        combined_graph.addN((s, p, o, combined_graph) for s, p, o in laderr_graph)
 
         return combined_graph
 
@@ -350,13 +361,18 @@ class GraphHandler:
         :return: A cleaned RDF graph containing only relevant triples.
         :rtype: Graph
         """
-        triples_to_remove = {(s, p, o) for s, p, o in graph if
-                             (not str(s).startswith(base_url))  # Remove triples where subject is not in base_url
-                             or isinstance(s, BNode) or isinstance(p, BNode) or isinstance(o,
-                                                                                           BNode)  # Remove triples with blank nodes
-                             or (p == RDF.type and o == RDFS.Resource)  # Remove "X a rdfs:Resource"
-                             or (p == OWL.topObjectProperty)  # Remove "X owl:topObjectProperty Y"
-                             }
+        # Fixed patterns are removed through the store indexes, without scanning the graph
+        graph.remove((None, RDF.type, RDFS.Resource))  # Remove "X a rdfs:Resource"
+        graph.remove((None, OWL.topObjectProperty, None))  # Remove "X owl:topObjectProperty Y"
+
+        # The subject test is evaluated once per distinct subject instead of once per triple
+        foreign_subjects = {s for s in graph.subjects(unique=True)
+                            if isinstance(s, BNode) or not str(s).startswith(base_url)}
+
+        triples_to_remove = [(s, p, o) for s, p, o in graph if
+                             s in foreign_subjects  # Remove triples where subject is not in base_url
+                             or isinstance(p, BNode) or isinstance(o, BNode)  # Remove triples with blank nodes
+                             ]
 
         for triple in triples_to_remove:
             graph.remove(triple)
@@ -51,13 +51,15 @@ class ReasoningHandler:
         graph.bind("", base_prefix)  # Bind the `laderr:` namespace
         graph.bind("laderr", LADERR_NS)  # Bind the `laderr:` namespace
 
+        rdfs_closure = DeductiveClosure(RDFS_Semantics)
+
         iteration = 0
+        hash_before = ReasoningHandler._calculate_hash(graph)
         while True:
             iteration += 1
             logger.success(f"Starting reasoning iteration {iteration}. Current number of triples is {len(graph)}.")
-            hash_before = ReasoningHandler._calculate_hash(graph)
 
-            DeductiveClosure(RDFS_Semantics).expand(graph)
+            rdfs_closure.expand(graph)
             InferenceRules.execute_rule_disposition_state(graph)
             InferenceRules.execute_rule_entity_protects(graph)
             InferenceRules.execute_rule_entity_threatens(graph)
@@ -74,5 +76,8 @@ class ReasoningHandler:
             if hash_before == hash_after:
                 break
 
+            # The graph is untouched until the next iteration starts, so its hash can be carried over
+            hash_before = hash_after
+
         logger.success(f"Reasoning concluded after {iteration} iteration(s). Final number of triples is {len(graph)}.")
         return GraphHandler._clean_graph(graph, base_prefix)
@@ -12,7 +12,7 @@ from reportlab.pdfgen import canvas
 
 from laderr_engine.laderr_lib.globals import LADERR_NS
 from laderr_engine.laderr_lib.services.graph import GraphHandler
-from laderr_engine.laderr_lib.services.visualization import VisualizationCreator
+from laderr_engine.laderr_lib.services.visualization import VisualizationCreator, TypeIndex
 
 
 class ReportGenerator:
@@ -40,6 +40,7 @@ class ReportGenerator:
     @staticmethod
     def generate_pdf_report(graph: Graph, output_path: str = "laderr_report"):
         scenario_graphs = GraphHandler._split_graph_by_scenario(graph)
+        type_index = TypeIndex(graph)  # Shared by the visualizations of all scenarios
 
         for scenario_id, scenario_graph in scenario_graphs.items():
             metrics = ReportGenerator._calculate_resilience_metrics(scenario_graph)
@@ -49,7 +50,7 @@ class ReportGenerator:
             width, height = A4
 
             visualization_paths = VisualizationCreator.create_graph_visualization(scenario_graph,
-                tempfile.mktemp(suffix=f"_{scenario_id}")[:-4])
+                tempfile.mktemp(suffix=f"_{scenario_id}")[:-4], type_index=type_index)
 
             title_top_y = height - 2 * cm
 
@@ -201,17 +202,18 @@ class ReportGenerator:
         entities = set(graph.subjects(RDF.type, LADERR_NS.Entity))
         resiliences = set(graph.subjects(RDF.type, LADERR_NS.Resilience))
 
-        disabled = LADERR_NS.disabled
-        state = LADERR_NS.state
         exploits = LADERR_NS.exploits
 
+        # Computed once, so the state of each disposition is checked with a set lookup instead of a graph query
+        disabled_subjects = frozenset(graph.subjects(LADERR_NS.state, LADERR_NS.disabled))
+
         count_total_vul = len(vulnerabilities)
         count_total_cap = len(capabilities)
 
-        enabled_vul = sum(1 for v in vulnerabilities if (v, state, disabled) not in graph)
+        enabled_vul = sum(1 for v in vulnerabilities if v not in disabled_subjects)
         disabled_vul = count_total_vul - enabled_vul
 
-        enabled_cap = sum(1 for c in capabilities if (c, state, disabled) not in graph)
+        enabled_cap = sum(1 for c in capabilities if c not in disabled_subjects)
         disabled_cap = count_total_cap - enabled_cap
 
         exploited_enabled = 0
@@ -220,7 +222,7 @@ class ReportGenerator:
         not_exploited_disabled = 0
 
         for v in vulnerabilities:
-            is_disabled = (v, state, disabled) in graph
+            is_disabled = v in disabled_subjects
             has_exploit = bool(list(graph.subjects(exploits, v)))
 
             if is_disabled and not has_exploit:
@@ -260,13 +262,13 @@ class ReportGenerator:
 
         # Vulnerability subsets
         enabled_exploited = [v for v in vulnerabilities if
-                             (v, state, disabled) not in graph and list(graph.subjects(exploits, v))]
+                             v not in disabled_subjects and list(graph.subjects(exploits, v))]
         enabled_not_exploited = [v for v in vulnerabilities if
-                                 (v, state, disabled) not in graph and not list(graph.subjects(exploits, v))]
+                                 v not in disabled_subjects and not list(graph.subjects(exploits, v))]
         disabled_exploited = [v for v in vulnerabilities if
-                              (v, state, disabled) in graph and list(graph.subjects(exploits, v))]
+                              v in disabled_subjects and list(graph.subjects(exploits, v))]
         disabled_not_exploited = [v for v in vulnerabilities if
-                                  (v, state, disabled) in graph and not list(graph.subjects(exploits, v))]
+                                  v in disabled_subjects and not list(graph.subjects(exploits, v))]
 
         all_exposed_capabilities = get_exposed_by(vulnerabilities)
         exposed_by_enabled_exploited = get_exposed_by(enabled_exploited)
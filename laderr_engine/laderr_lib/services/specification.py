@@ -231,6 +231,9 @@ class SpecificationHandler:
         """
         data = {}
 
+        # URIRef subclasses str, so terms are tested against the namespace prefix directly, without conversions
+        laderr_prefix = str(LADERR_NS)
+
         # Extract the Specification instance
         specification_uri = None
         for s, p, o in laderr_graph.triples((None, RDF.type, LADERR_NS.Specification)):
@@ -245,7 +248,7 @@ class SpecificationHandler:
         metadata_keys = {"title", "description", "version", "createdBy", "createdOn", "modifiedOn", "baseURI"}
 
         for p, o in laderr_graph.predicate_objects(specification_uri):
-            key = p.split("#")[-1] if str(p).startswith(str(LADERR_NS)) else None
+            key = p.split("#")[-1] if p.startswith(laderr_prefix) else None
             if key and key in metadata_keys:
                 if isinstance(o, Literal):
                     value = o.toPython()
@@ -279,7 +282,7 @@ class SpecificationHandler:
         scenario_membership = defaultdict(list)
 
         for s, p, o in laderr_graph.triples((None, RDF.type, None)):
-            class_type = str(o).split("#")[-1] if str(o).startswith(str(LADERR_NS)) else None
+            class_type = str(o).split("#")[-1] if o.startswith(laderr_prefix) else None
             if class_type and class_type in specific_classes:
                 instance_id = str(s).split("#")[-1]
                 constructs[class_type][instance_id] = {}
@@ -289,7 +292,7 @@ class SpecificationHandler:
             for instance_id in instances:
                 instance_uri = URIRef(f"{metadata['baseURI']}{instance_id}")
                 for p, o in laderr_graph.predicate_objects(instance_uri):
-                    key = p.split("#")[-1] if str(p).startswith(str(LADERR_NS)) else None
+                    key = p.split("#")[-1] if p.startswith(laderr_prefix) else None
                     if key is None and p == RDFS.label:
                         key = "label"
                     if key and key not in {"type"}:
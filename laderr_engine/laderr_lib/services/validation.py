@@ -5,6 +5,7 @@ This module provides functions to perform syntactic and semantic validation of L
 as well as SHACL validation of RDF graphs.
 """
 
+import functools
 import os
 
 from loguru import logger
@@ -42,13 +43,50 @@ class ValidationHandler:
 
         combined_graph = GraphHandler._create_combined_graph(laderr_graph)
 
-        shacl_graph = ValidationHandler._load_shacl_schemas(SHACL_FILES_PATH)
+        shacl_graph = ValidationHandler._create_shacl_graph(SHACL_FILES_PATH)
 
         conforms, report_graph, report_text = validate(data_graph=combined_graph, shacl_graph=shacl_graph,
                                                        inference="both", allow_infos=True, allow_warnings=True)
 
         return conforms, report_graph, report_text
 
+    @staticmethod
+    def _create_shacl_graph(shacl_files_path: str) -> Graph:
+        """
+        Creates a new graph holding the SHACL shapes found in a directory.
+
+        pySHACL adds inferred triples to the shapes graph it receives, so every validation gets its own graph built
+        from the memoized SHACL schema contents instead of sharing a single parsed graph.
+
+        :param shacl_files_path: Directory path containing SHACL schema files.
+        :type shacl_files_path: str
+        :return: A new RDFLib graph containing all loaded SHACL shapes and their namespace bindings.
+        :rtype: Graph
+        """
+        triples, namespaces = ValidationHandler._get_shacl_schema_contents(shacl_files_path)
+
+        shacl_graph = Graph()
+        for prefix, namespace in namespaces:
+            shacl_graph.bind(prefix, namespace)
+        shacl_graph.addN((s, p, o, shacl_graph) for s, p, o in triples)
+
+        return shacl_graph
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_shacl_schema_contents(shacl_files_path: str) -> tuple[tuple, tuple]:
+        """
+        Returns the triples and namespace bindings of the SHACL schemas in a directory, parsing the files only on the
+        first call for each directory.
+
+        :param shacl_files_path: Directory path containing SHACL schema files.
+        :type shacl_files_path: str
+        :return: A tuple containing the SHACL triples and the (prefix, namespace) bindings of the merged schemas.
+        :rtype: tuple[tuple, tuple]
+        """
+        shacl_graph = ValidationHandler._load_shacl_schemas(shacl_files_path)
+        return tuple(shacl_graph), tuple(shacl_graph.namespaces())
+
     @staticmethod
     def _load_shacl_schemas(shacl_files_path: str) -> Graph:
         """
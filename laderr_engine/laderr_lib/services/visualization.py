@@ -2,119 +2,380 @@
 Graph Visualization Module for LaDeRR RDF Graphs.
 
 This module provides functionality to generate visual representations of RDF graphs using Graphviz. It processes
-LaDeRR RDF models, extracts entities and relationships, applies predefined styles, and outputs a PNG visualization.
+LaDeRR RDF models, extracts entities and relationships, applies predefined styles, and outputs a PNG visualization (or
+another Graphviz output format, such as SVG).
 """
 import contextlib
+import functools
+import hashlib
 import io
+import os
+import shutil
+import tempfile
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
 
 import graphviz
+from graphviz.quoting import quote
 from loguru import logger
-from rdflib import Graph, RDF, BNode, URIRef, RDFS
+from rdflib import Graph, RDF, BNode, URIRef, RDFS, Literal
 
 from laderr_engine.laderr_lib.globals import LADERR_NS
 from laderr_engine.laderr_lib.services.graph import GraphHandler
 
+# Scenarios with more nodes than this are laid out with sfdp instead of dot.
+SFDP_GRAPH_NODES = 500
+
+# Scenarios with more nodes than this are rendered in a degraded mode: lower resolution, no edge labels and straight
+# edges.
+LARGE_GRAPH_NODES = 2000
+
+# Maximum number of scenarios rendered concurrently by Graphviz.
+RENDER_WORKERS = 4
+
+# Part of the visualization cache key. Bump it whenever a change to this module alters the rendered output, so
+# renderings cached by previous versions are not reused.
+_RENDERER_VERSION = "1"
+
+# Edge colors keyed by predicate URI, so edges are styled without deriving the predicate's local name.
+_EDGE_COLORS = {
+    LADERR_NS.protects: "blue",
+    LADERR_NS.inhibits: "blue",
+    LADERR_NS.threatens: "blue",
+    LADERR_NS.preserves: "orange",
+    LADERR_NS.preservesAgainst: "orange",
+    LADERR_NS.preservesDespite: "orange",
+    LADERR_NS.sustains: "orange",
+    LADERR_NS.cannotDamage: "green",
+    LADERR_NS.notDamaged: "green",
+    LADERR_NS.canDamage: "red",
+    LADERR_NS.damaged: "red",
+    LADERR_NS.disables: "darkred",
+}
+_HIDDEN_EDGE_PREDICATES = frozenset({LADERR_NS.positiveDamage, LADERR_NS.negativeDamage})
+_DIAMOND_TAIL_PREDICATES = frozenset({LADERR_NS.capabilities, LADERR_NS.vulnerabilities, LADERR_NS.resiliences})
+
+# Graph attributes shared by all visualizations, and node attributes set once as node defaults.
+_GRAPH_ATTRIBUTES = {"fontname": "Arial", "nodesep": "0.2", "ranksep": "0.4", "labelloc": "t", "labeljust": "l",
+                     "fontsize": "10"}
+_NODE_ATTRIBUTES = {"fixedsize": "true", "width": "0.6", "height": "0.6", "fontname": "Arial Bold", "fontsize": "6",
+                    "margin": "0.05", "penwidth": "1", "fillcolor": "white"}
+
+# Node dispatch tables, keyed by the local names of the instance types.
+_DISPOSITION_TYPES = frozenset({"Disposition", "Capability", "Vulnerability"})
+_ENTITY_KINDS = frozenset({"Asset", "Control", "Threat"})
+_ENTITY_BASE_STYLE = {"shape": "square", "color": "black", "style": "filled"}
+_ENTITY_COLORS = {"Asset": "lightgreen", "Control": "#789df5", "Threat": "lightcoral"}
+_DISPOSITION_BASE_STYLE = {"shape": "circle", "style": "filled", "color": "black"}
+# Disposition fill colors keyed by (is_capability, is_vulnerability), indexed by is_disabled.
+_DISPOSITION_FILLCOLORS = {
+    (True, True): ("lightgreen:lightcoral", "darkgreen:darkred"),
+    (True, False): ("lightgreen", "darkgreen"),
+    (False, True): ("lightcoral", "darkred"),
+    (False, False): ("grey", "grey"),
+}
+_RESILIENCE_STYLE = {"shape": "ellipse", "color": "black", "style": "filled", "fillcolor": "orange"}
+_DEFAULT_NODE_STYLE = {"shape": "ellipse", "color": "black", "style": "filled"}
+
+# Scenario background colors keyed by the scenario status URI.
+_SCENARIO_BGCOLORS = {LADERR_NS.resilient: "#EBFFEB", LADERR_NS.vulnerable: "#FDE8E8"}
+
+# DOT statement templates. Nodes and edges are appended to the Digraph body directly, bypassing the per-call argument
+# handling of Digraph.node and Digraph.edge.
+_NODE_STATEMENT = "\t{node} [label={label} {attributes}]\n"
+_EDGE_STATEMENT = "\t{tail} -> {head} [{attributes}]\n"
+
+# Quoted DOT identifiers repeat across nodes and edges, so each one is quoted only once.
+_quote = functools.lru_cache(maxsize=65536)(quote)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_attributes(items: tuple) -> str:
+    """
+    Formats attribute name-value pairs as a DOT attribute list.
+
+    :param items: Attribute name-value pairs, in the order in which they are written.
+    :type items: tuple
+    :return: The DOT attribute list, without the enclosing brackets.
+    :rtype: str
+    """
+    return " ".join(f"{name}={quote(value)}" for name, value in items)
+
+
+@functools.lru_cache(maxsize=65536)
+def _local_name(term) -> str:
+    """
+    Returns the local name of a URI, i.e., the part after its last '#'.
+
+    Terms repeat heavily across triples and scenarios, so each distinct term is split only once.
+
+    :param term: The RDF term whose local name is returned.
+    :type term: URIRef
+    :return: The local name of the term.
+    :rtype: str
+    """
+    return str(term).rpartition("#")[2]
+
+
+class TypeIndex:
+    """
+    Index of the node-level information needed to style the components of a LaDeRR graph: the types, labels and
+    disabled state of each node.
+
+    VisualizationCreator.create_graph_visualization builds the index from the graph it is given. Callers that
+    visualize several parts of the same graph, such as the per-scenario graphs of a report, can build the index once
+    from the full graph and pass it to every call, so the full graph is not scanned again for each part. The index is
+    a snapshot: it does not reflect changes made to the graph after it was built.
+
+    :ivar types_by_subject: Local names of the rdf:type values of each subject, as frozensets.
+    :ivar labels: The rdfs:label of each labeled subject.
+    :ivar disabled_subjects: Subjects whose state is disabled.
+    """
+
+    def __init__(self, graph: Graph):
+        """
+        Builds the index from the given graph.
+
+        :param graph: The RDF graph to index.
+        :type graph: Graph
+        """
+        # Each lookup goes through the store's predicate index, so triples of other predicates are never visited.
+        self.types_by_subject = defaultdict(set)
+        for s, _, o in graph.triples((None, RDF.type, None)):
+            self.types_by_subject[s].add(_local_name(o))
+
+        self.labels = {s: o for s, _, o in graph.triples((None, RDFS.label, None))}
+        self.disabled_subjects = set(graph.subjects(LADERR_NS.state, LADERR_NS.disabled))
+
+        # Frozen, so each node's types can be intersected with the dispatch sets without further conversion.
+        self.types_by_subject = {s: frozenset(types) for s, types in self.types_by_subject.items()}
+
 
 class VisualizationCreator:
     """
     Handles visualization of RDF graphs using Graphviz.
 
     This class provides methods to generate a visual representation of an RDF graph, styling nodes based on their
-    types and relationships. The generated graph is saved as a PNG image.
+    types and relationships. The generated graph is saved as a PNG image by default.
     """
 
     @staticmethod
-    def create_graph_visualization(laderr_graph: Graph, base_output_path: str):
+    def create_graph_visualization(laderr_graph: Graph, base_output_path: str, engine: Optional[str] = None,
+                                   type_index: Optional[TypeIndex] = None, output_format: str = "png",
+                                   draft: bool = False, cache_dir: Optional[str] = None):
+        """
+        Generates one visualization per Scenario of the given RDF graph.
+
+        Each scenario is handed to Graphviz as soon as its DOT source is built, and up to RENDER_WORKERS scenarios
+        are rendered concurrently.
+
+        :param laderr_graph: The RDF graph to visualize.
+        :type laderr_graph: Graph
+        :param base_output_path: Base path for the generated files; the scenario identifier is appended to it.
+        :type base_output_path: str
+        :param engine: Graphviz layout engine to use. If not provided, 'dot' is used for regular graphs and 'sfdp'
+                       for scenarios with more than SFDP_GRAPH_NODES nodes.
+        :type engine: Optional[str]
+        :param type_index: Index of the types, labels and states of the graph's nodes. If not provided, it is built
+                           from laderr_graph. Callers visualizing several parts of the same graph may build it once
+                           from the full graph and pass it to each call.
+        :type type_index: Optional[TypeIndex]
+        :param output_format: Graphviz output format. Vector formats such as 'svg' skip rasterization, which is the
+                              most expensive rendering step for large graphs. Defaults to 'png'.
+        :type output_format: str
+        :param draft: Whether to render at 96 dpi instead of 300 dpi. Rasterization time grows with the pixel count,
+                      so drafts render considerably faster; intended for previews and automated checks only.
+        :type draft: bool
+        :param cache_dir: Directory in which renderings are cached, keyed by the scenario graph and the rendering
+                          options. When given, unchanged scenarios are copied from the cache instead of being rendered
+                          again. Defaults to None, which disables caching.
+        :type cache_dir: Optional[str]
+        :return: List of paths to the rendered files, in scenario order.
+        :rtype: list[str]
+        """
         scenario_graphs = GraphHandler._split_graph_by_scenario(laderr_graph)
+        # Holds, in scenario order, either the path of a file copied from the cache, or the pending rendering and the
+        # cache path under which its result is stored.
+        renders = []
 
-        for scenario_id, subgraph in scenario_graphs.items():
-            scenario_uri = next(subgraph.subjects(RDF.type, LADERR_NS.Scenario), None)
-            if scenario_uri is None:
-                continue
+        # Each scenario is rendered in its own Graphviz process as soon as its DOT source is built, so Graphviz runs
+        # while the sources of the following scenarios are being built, and independent scenarios render concurrently.
+        # Graphviz warnings are suppressed.
+        with contextlib.redirect_stderr(io.StringIO()), ThreadPoolExecutor(max_workers=RENDER_WORKERS) as executor:
+            for scenario_id in list(scenario_graphs):
+                subgraph = scenario_graphs.pop(scenario_id)  # Only the scenario being built is kept alive
+                scenario_uri = next(subgraph.subjects(RDF.type, LADERR_NS.Scenario), None)
+                if scenario_uri is None:
+                    continue
 
-            scenario_label = subgraph.value(scenario_uri, RDFS.label)
-            scenario_status = subgraph.value(scenario_uri, LADERR_NS.status)
-            scenario_situation = subgraph.value(scenario_uri, LADERR_NS.situation)
+                scenario_label = subgraph.value(scenario_uri, RDFS.label)
+                scenario_status = subgraph.value(scenario_uri, LADERR_NS.status)
+                scenario_situation = subgraph.value(scenario_uri, LADERR_NS.situation)
 
-            bgcolor = VisualizationCreator._get_scenario_bgcolor_for_uri(subgraph, scenario_uri)
+                bgcolor = VisualizationCreator._get_scenario_bgcolor(scenario_status)
 
-            # Clean label text format
-            situation_str = str(scenario_situation).split("#")[-1].upper() if scenario_situation else "UNKNOWN"
-            status_str = str(scenario_status).split("#")[-1].upper() if scenario_status else "UNKNOWN"
-            label_str = str(scenario_label) if scenario_label else scenario_id
+                # Clean label text format
+                situation_str = _local_name(scenario_situation).upper() if scenario_situation else "UNKNOWN"
+                status_str = _local_name(scenario_status).upper() if scenario_status else "UNKNOWN"
+                label_str = str(scenario_label) if scenario_label else scenario_id
 
-            label_text = f"[{situation_str}] Scenario {label_str}: {status_str}"
+                label_text = f"[{situation_str}] Scenario {label_str}: {status_str}"
 
-            # Just pass the full label text (already constructed)
-            dot = VisualizationCreator._initialize_graph(bgcolor, label_text)
-
-            added_nodes = VisualizationCreator._process_nodes(subgraph, dot, scenario_uri)
-            VisualizationCreator._process_edges(subgraph, dot, added_nodes)
-
-            rendered_paths = []
-            if added_nodes:
                 output_path = f"{base_output_path}_{scenario_id}"
 
-                # Suppress Graphviz warnings
-                with contextlib.redirect_stderr(io.StringIO()):
-                    rendered_path = dot.render(output_path, cleanup=True)
+                # Unchanged scenarios reuse a previous rendering, skipping both the graph traversal and Graphviz.
+                cache_path = None
+                if cache_dir is not None:
+                    cache_key = VisualizationCreator._get_cache_key(subgraph, _RENDERER_VERSION, engine or "auto",
+                                                                    "draft" if draft else "final")
+                    cache_path = Path(cache_dir) / f"{cache_key}.{output_format}"
+                    if cache_path.exists():
+                        rendered_path = f"{output_path}.{output_format}"
+                        os.makedirs(os.path.dirname(rendered_path) or ".", exist_ok=True)
+                        shutil.copyfile(cache_path, rendered_path)
+                        renders.append((rendered_path, None))
+                        continue
+
+                if type_index is None:
+                    type_index = TypeIndex(laderr_graph)
+
+                # Just pass the full label text (already constructed)
+                dot = VisualizationCreator._initialize_graph(bgcolor, label_text, output_format, draft)
+
+                added_nodes = VisualizationCreator._build_visualization(subgraph, dot, scenario_uri, type_index)
+
+                # The engine is chosen once the number of nodes is known
+                scenario_engine = engine or ("sfdp" if len(added_nodes) > SFDP_GRAPH_NODES else "dot")
+                VisualizationCreator._set_layout_engine(dot, scenario_engine)
+
+                if added_nodes:
+                    future = executor.submit(VisualizationCreator._render_source, dot, output_path)
+                    renders.append((future, cache_path))
+                else:
+                    logger.info(f"Scenario {scenario_id} skipped: no nodes to visualize.")
 
+            rendered_paths = []
+            for render, cache_path in renders:
+                if isinstance(render, Future):
+                    rendered_path = render.result()
+                    if cache_path is not None:
+                        VisualizationCreator._store_in_cache(rendered_path, cache_path)
+                else:
+                    rendered_path = render
                 rendered_paths.append(rendered_path)
-            else:
-                logger.info(f"Scenario {scenario_id} skipped: no nodes to visualize.")
 
         return rendered_paths
 
     @staticmethod
-    def _validate_output_path(output_file_path: str) -> None:
+    def _get_cache_key(graph: Graph, *render_params: str) -> str:
+        """
+        Computes a key identifying the rendering of a graph with the given parameters.
+
+        The graph is canonicalized by sorting its N-Triples serialization, so the key does not depend on the order in
+        which the triples were added.
+
+        :param graph: The RDF graph to be rendered.
+        :type graph: Graph
+        :param render_params: Rendering parameters that affect the output (e.g., renderer version and layout engine).
+        :type render_params: str
+        :return: Hexadecimal digest identifying the rendering.
+        :rtype: str
+        """
+        ntriples = sorted(graph.serialize(format="nt").splitlines())
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update("\n".join(ntriples).encode("utf-8"))
+        for param in render_params:
+            digest.update(b"\0" + param.encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _store_in_cache(rendered_path: str, cache_path: Path) -> None:
+        """
+        Copies a rendered file into the visualization cache. Failures are logged and otherwise ignored, as the cache
+        is only an optimization.
+
+        The file is copied to a temporary file in the cache directory and then moved into place, so concurrent runs
+        never read a partially written cache entry.
+
+        :param rendered_path: Path to the rendered file.
+        :type rendered_path: str
+        :param cache_path: Path under which the rendered file is cached.
+        :type cache_path: Path
+        """
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+            os.close(fd)
+            try:
+                shutil.copyfile(rendered_path, temp_path)
+                os.replace(temp_path, cache_path)
+            except OSError:
+                os.remove(temp_path)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not cache visualization '{rendered_path}': {e}")
+
+    @staticmethod
+    def _render_source(dot: graphviz.Digraph, output_path: str) -> str:
         """
-        Validates that the output file path ends with '.png'.
+        Writes the DOT source of the Digraph to disk and renders it with the Graphviz binary.
+
+        The source lines are streamed straight to the file, so no full source string is assembled in memory, and the
+        layout runs on the saved file. The intermediate source file is removed after rendering.
 
-        :param output_file_path: Path where the visualization will be saved.
-        :type output_file_path: str
-        :raises ValueError: If the output file does not have a '.png' extension.
+        :param dot: The Digraph to render.
+        :type dot: graphviz.Digraph
+        :param output_path: Path of the DOT source file; the rendered file is saved with the format as extension.
+        :type output_path: str
+        :return: Path to the rendered file.
+        :rtype: str
         """
-        if not output_file_path.lower().endswith(".png"):
-            raise ValueError(f"Invalid file path: '{output_file_path}'. The output file must have a '.png' extension.")
+        engine, output_format = dot.engine, dot.format
+        source_path = dot.save(output_path)
+        dot.clear()  # Release the accumulated source lines before spawning Graphviz
+
+        try:
+            return graphviz.render(engine, output_format, source_path)
+        finally:
+            os.remove(source_path)
 
     @staticmethod
-    def _initialize_graph(bgcolor: str = "white", label_text: str = "") -> graphviz.Digraph:
+    def _initialize_graph(bgcolor: str = "white", label_text: str = "", output_format: str = "png",
+                          draft: bool = False) -> graphviz.Digraph:
         """
         Initializes a Graphviz Digraph with predefined attributes, including background color and label text.
+        Drafts are rendered at 96 dpi instead of 300 dpi.
         """
-        dot = graphviz.Digraph(format='png')
-        dot.attr(
-            dpi='300',
-            fontname="Arial",
-            nodesep="0.2",
-            ranksep="0.4",
-            labelloc="t",
-            bgcolor=bgcolor,
-            labeljust='l',
-            fontsize="10",
-            label=label_text
-        )
-        return dot
+        graph_attributes = {**_GRAPH_ATTRIBUTES, "dpi": "96" if draft else "300", "bgcolor": bgcolor,
+                            "label": label_text}
+        return graphviz.Digraph(format=output_format, graph_attr=graph_attributes, node_attr=_NODE_ATTRIBUTES)
 
     @staticmethod
-    def _get_scenario_bgcolor_for_uri(graph: Graph, scenario_uri: URIRef) -> str:
-        scenario_colors = {
-            'resilient': '#EBFFEB',
-            'vulnerable': '#FDE8E8'
-        }
-        status = graph.value(scenario_uri, LADERR_NS.status)
-        if status:
-            status_value = str(status).split("#")[-1].lower()
-            return scenario_colors.get(status_value, "white")
-        return "white"
+    def _set_layout_engine(dot: graphviz.Digraph, engine: str) -> None:
+        """
+        Sets the Graphviz layout engine of the Digraph.
+
+        When the 'sfdp' engine is selected, node overlaps are removed with the 'prism' algorithm and edges are drawn
+        as straight lines, as spline routing is the most expensive step of large force-directed layouts.
+
+        :param dot: The Digraph whose layout engine is set.
+        :type dot: graphviz.Digraph
+        :param engine: Name of the Graphviz layout engine.
+        :type engine: str
+        """
+        dot.engine = engine
+        if engine == "sfdp":
+            dot.attr(overlap="prism", splines="line")
 
     @staticmethod
-    def _get_scenario_type(graph: Graph, scenario: URIRef) -> str:
-        situation = graph.value(scenario, LADERR_NS.situation)
-        return str(situation).split("#")[-1].upper() if situation else ""
+    def _get_scenario_bgcolor(status: Optional[URIRef]) -> str:
+        return _SCENARIO_BGCOLORS.get(status, "white")
 
     @staticmethod
-    def _get_disposition_style(instance_types: list, is_disabled: bool) -> dict:
+    @functools.lru_cache(maxsize=64)
+    def _get_disposition_style(instance_types: frozenset, is_disabled: bool) -> dict:
         """
         Determines the visual style of a Disposition based on whether it is a Capability, Vulnerability, or both,
         and whether it is enabled or disabled.
@@ -127,161 +388,189 @@ class VisualizationCreator:
             - Enabled: light green and light red (lightcoral)
             - Disabled: dark green and dark red
 
-        :param instance_types: List of types associated with the disposition.
-        :type instance_types: list
+        :param instance_types: Set of types associated with the disposition.
+        :type instance_types: frozenset
         :param is_disabled: Whether the disposition is currently disabled.
         :type is_disabled: bool
-        :return: A dictionary containing Graphviz node style attributes.
+        :return: A dictionary containing Graphviz node style attributes. Results are memoized, so the dictionary is
+                 shared and must not be modified.
         :rtype: dict
         """
-        base_style = {"shape": "circle", "style": "filled", "color": "black"}
-
-        is_capability = "Capability" in instance_types
-        is_vulnerability = "Vulnerability" in instance_types
-
-        if is_capability and is_vulnerability:
-            fillcolor = "darkgreen:darkred" if is_disabled else "lightgreen:lightcoral"
-            style = "wedged"
-        elif is_capability:
-            fillcolor = "darkgreen" if is_disabled else "lightgreen"
-            style = "filled"
-        elif is_vulnerability:
-            fillcolor = "darkred" if is_disabled else "lightcoral"
-            style = "filled"
-        else:
-            fillcolor = "grey"
-            style = "filled"
+        kind = ("Capability" in instance_types, "Vulnerability" in instance_types)
+        fillcolor = _DISPOSITION_FILLCOLORS[kind][is_disabled]
+        style = "wedged" if all(kind) else "filled"
 
-        return {**base_style, "fillcolor": fillcolor, "style": style}
+        return {**_DISPOSITION_BASE_STYLE, "fillcolor": fillcolor, "style": style}
 
     @staticmethod
-    def _get_entity_style(instance_types: list) -> dict:
+    @functools.lru_cache(maxsize=64)
+    def _get_entity_style(entity_hits: frozenset) -> dict:
         """
         Determines the visual style of an Entity based on its subtypes using appropriate Graphviz styles.
 
-        :param instance_types: List of types associated with the entity.
-        :type instance_types: list
-        :return: A dictionary containing Graphviz node style attributes.
+        :param entity_hits: Entity subtypes (Asset, Control, Threat) of the entity.
+        :type entity_hits: frozenset
+        :return: A dictionary containing Graphviz node style attributes. Results are memoized, so the dictionary is
+                 shared and must not be modified.
         :rtype: dict
         """
-        node_styles = {"Entity": {"shape": "square", "color": "black", "style": "filled"},
-                       "Asset": {"color": "lightgreen"},
-                       "Control": {"color": "#789df5"}, "Threat": {"color": "lightcoral"}}
-
-        base_style = node_styles["Entity"]
-        entity_types = [t for t in ["Asset", "Control", "Threat"] if t in instance_types]
+        base_style = _ENTITY_BASE_STYLE
+        entity_types = sorted(entity_hits)  # Alphabetical order matches Asset, Control, Threat
 
         if not entity_types:
             return {**base_style, "fillcolor": "grey", "style": "filled"}
 
         if len(entity_types) == 1:
-            return {**base_style, "fillcolor": node_styles[entity_types[0]]["color"], "style": "filled"}
+            return {**base_style, "fillcolor": _ENTITY_COLORS[entity_types[0]], "style": "filled"}
 
         if len(entity_types) == 2:
             return {**base_style,
-                    "fillcolor": f"{node_styles[entity_types[0]]['color']}:{node_styles[entity_types[1]]['color']}",
+                    "fillcolor": f"{_ENTITY_COLORS[entity_types[0]]}:{_ENTITY_COLORS[entity_types[1]]}",
                     "style": "striped"}
 
         if len(entity_types) == 3:
             return {**base_style,
-                    "fillcolor": f"{node_styles['Asset']['color']};0.33:{node_styles['Control']['color']};0.33:{node_styles['Threat']['color']};0.34",
+                    "fillcolor": f"{_ENTITY_COLORS['Asset']};0.33:{_ENTITY_COLORS['Control']};0.33:{_ENTITY_COLORS['Threat']};0.34",
                     "style": "striped"}
 
         return base_style  # Fallback, should not be reached
 
     @staticmethod
-    def _process_nodes(graph: Graph, dot: graphviz.Digraph, scenario: URIRef) -> set:
-        added_nodes = set()
-
-        # Changed from laderr:constructs to laderr:components
-        for _, _, node in graph.triples((scenario, LADERR_NS.components, None)):
-            # Optionally remove the label check, or leave it if you want to enforce it
-            # if (node, LADERR_NS.label, None) not in graph:
-            #     continue
-            added_nodes.add(node)
-
-        for s in added_nodes:
-            instance_types = [str(o).split("#")[-1] for o in graph.objects(s, RDF.type)]
-            instance_id = str(s).split("#")[-1]
-            instance_label = str(graph.value(s, RDFS.label)) or instance_id
-            is_disabled = (s, LADERR_NS.state, LADERR_NS.disabled) in graph
-
-            if "Resilience" in instance_types:
-                style = {"shape": "ellipse", "color": "black", "style": "filled", "fillcolor": "orange"}
-            elif any(item in instance_types for item in ["Disposition", "Capability", "Vulnerability"]):
-                style = VisualizationCreator._get_disposition_style(instance_types, is_disabled)
-            elif "Entity" in instance_types:
-                style = VisualizationCreator._get_entity_style(instance_types)
-            else:
-                style = {"shape": "ellipse", "color": "black", "style": "filled"}
-
-            dot.node(
-                instance_id,
-                shape=style["shape"],
-                color=style["color"],
-                style=style["style"],
-                penwidth=style.get("penwidth", "1"),
-                fillcolor=style.get("fillcolor", "white"),
-                gradientangle=style.get("gradientangle", ""),
-                fixedsize="true",
-                width="0.6",
-                height="0.6",
-                fontname="Arial",
-                fontsize="6",
-                label=f"<<B>{instance_label}</B>>",
-                margin="0.05"
-            )
+    def _build_visualization(graph: Graph, dot: graphviz.Digraph, scenario: URIRef, type_index: TypeIndex) -> set:
+        """
+        Adds the components of a scenario as nodes, and the relations among them as edges, to the Digraph.
+
+        The graph is not scanned as a whole: the components are read from the scenario's laderr:components triples,
+        and candidate edges are looked up per component through the subject index, so structural triples of other
+        terms are never visited. Node types, labels and states are taken from the prebuilt type index.
+
+        Scenarios with more than LARGE_GRAPH_NODES nodes are drawn in a degraded mode, which Graphviz can still render
+        in reasonable time.
+
+        :param graph: The scenario graph to visualize.
+        :type graph: Graph
+        :param dot: The Digraph to which nodes and edges are added.
+        :type dot: graphviz.Digraph
+        :param scenario: The URI of the scenario whose components are visualized.
+        :type scenario: URIRef
+        :param type_index: Index of the types, labels and states of the nodes.
+        :type type_index: TypeIndex
+        :return: Set of RDF terms added as nodes.
+        :rtype: set
+        """
+        added_nodes = set(graph.objects(scenario, LADERR_NS.components))
+
+        degraded = len(added_nodes) > LARGE_GRAPH_NODES
+        if degraded:
+            dot.attr(dpi="96", splines="line")
+
+        # Nodes are emitted grouped by category, which helps dot's rank assignment, and sorted by identifier within
+        # each category. Edges follow the same node order and are sorted per node, so the generated source is
+        # deterministic.
+        types_by_subject = type_index.types_by_subject
+        ordered_nodes = sorted(added_nodes, key=lambda node: (
+            VisualizationCreator._get_node_category(types_by_subject.get(node, frozenset())), _local_name(node)))
+
+        for node in ordered_nodes:
+            VisualizationCreator._add_node(dot, _local_name(node), types_by_subject.get(node, frozenset()),
+                                           type_index.labels.get(node), node in type_index.disabled_subjects)
+
+        for s in ordered_nodes:
+            edges = sorted((p, o) for p, o in graph.predicate_objects(s)
+                           if o in added_nodes and isinstance(o, (URIRef, BNode)) and p not in _HIDDEN_EDGE_PREDICATES)
+            for p, o in edges:
+                VisualizationCreator._add_edge(dot, _local_name(s), p, _local_name(o), degraded)
 
         return added_nodes
 
     @staticmethod
-    def _process_edges(graph: Graph, dot: graphviz.Digraph, added_nodes: set) -> None:
-        edge_styles = {
-            "protects": "blue",
-            "inhibits": "blue",
-            "threatens": "blue",
-            "preserves": "orange",
-            "preservesAgainst": "orange",
-            "preservesDespite": "orange",
-            "sustains": "orange",
-            "cannotDamage": "green",
-            "notDamaged": "green",
-            "canDamage": "red",
-            "damaged": "red",
-            "disables": "darkred",
-        }
-
-        for s, p, o in graph:
-            if s not in added_nodes or o not in added_nodes:
-                continue
-            if not isinstance(o, (URIRef, BNode)):
-                continue
-            s_id = str(s).split("#")[-1]
-            o_id = str(o).split("#")[-1]
-            if s_id == o_id:
-                continue
-
-            pred_label = p.split("#")[-1]
-
-            if pred_label in {"positiveDamage", "negativeDamage"}:
-                continue  # Skip these relations
-
-            edge_color = edge_styles.get(pred_label, "black")  # Use colored style if defined
-
-            has_diamond_tail = pred_label in {"capabilities", "vulnerabilities", "resiliences"}
+    def _get_node_category(instance_types: frozenset) -> int:
+        """
+        Returns the emission order of a node's category: entities, then dispositions, then resiliences, then others.
+        The category of a node with several types follows the same precedence used to pick its style.
+
+        :param instance_types: Local names of the node's types.
+        :type instance_types: frozenset
+        :return: Sort key of the node's category.
+        :rtype: int
+        """
+        if "Resilience" in instance_types:
+            return 2
+        if instance_types & _DISPOSITION_TYPES:
+            return 1
+        if "Entity" in instance_types:
+            return 0
+        return 3
+
+    @staticmethod
+    def _add_node(dot: graphviz.Digraph, instance_id: str, instance_types: frozenset, label: Optional[Literal],
+                  is_disabled: bool) -> None:
+        """
+        Adds a single styled node to the Digraph.
+
+        Labels are plain strings, made bold through the 'Arial Bold' node font instead of HTML-like <B> markup, which
+        Graphviz parses considerably slower. As a consequence, a label cannot mix bold and regular text.
+        """
+        instance_label = str(label) or instance_id
+
+        if "Resilience" in instance_types:
+            style = _RESILIENCE_STYLE
+        elif instance_types & _DISPOSITION_TYPES:
+            style = VisualizationCreator._get_disposition_style(instance_types, is_disabled)
+        elif "Entity" in instance_types:
+            style = VisualizationCreator._get_entity_style(instance_types & _ENTITY_KINDS)
+        else:
+            style = _DEFAULT_NODE_STYLE
+
+        # Attributes shared by all nodes are set once as node defaults (_NODE_ATTRIBUTES).
+        dot.body.append(_NODE_STATEMENT.format(node=_quote(instance_id), label=quote(graphviz.nohtml(instance_label)),
+                                               attributes=_format_attributes(tuple(sorted(style.items())))))
 
+    @staticmethod
+    def _add_edge(dot: graphviz.Digraph, s_id: str, p: URIRef, o_id: str, degraded: bool = False) -> None:
+        """
+        Adds a single styled edge to the Digraph, unless it is a self-loop. In degraded mode, the edge is unlabeled.
+        """
+        if s_id == o_id:
+            return
+
+        dot.body.append(_EDGE_STATEMENT.format(
+            tail=_quote(s_id), head=_quote(o_id),
+            attributes=VisualizationCreator._get_edge_attributes(p, degraded)))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _get_edge_attributes(p: URIRef, degraded: bool) -> str:
+        """
+        Returns the formatted DOT attribute list of the edges of a predicate, labeled with the predicate's local name.
+
+        Edges of the same predicate share their style, so the attribute list, including the label, is built once per
+        predicate.
+
+        :param p: The predicate of the edge.
+        :type p: URIRef
+        :param degraded: Whether the graph is rendered in degraded mode, in which edges are unlabeled.
+        :type degraded: bool
+        :return: The DOT attribute list, without the enclosing brackets.
+        :rtype: str
+        """
+        edge_color = _EDGE_COLORS.get(p, "black")  # Use colored style if defined
+
+        if degraded:
+            arrow_attributes = {"color": edge_color}
+        else:
             arrow_attributes = {
-                "label": pred_label,
                 "fontsize": "6",
                 "color": edge_color,
                 "fontcolor": edge_color,
             }
 
-            if has_diamond_tail:
-                arrow_attributes.update({
-                    "dir": "both",
-                    "arrowtail": "diamond",
-                    "arrowhead": "none"
-                })
+        if p in _DIAMOND_TAIL_PREDICATES:
+            arrow_attributes.update({
+                "dir": "both",
+                "arrowtail": "diamond",
+                "arrowhead": "none"
+            })
 
-            dot.edge(s_id, o_id, **arrow_attributes)
+        formatted_attributes = _format_attributes(tuple(sorted(arrow_attributes.items())))
+        return formatted_attributes if degraded else f"label={quote(_local_name(p))} {formatted_attributes}"
@@ -1,36 +1,40 @@
+import functools
 import logging
 import os
 import tempfile
 import tomllib
 
 import pytest
+import tomli_w
 from loguru import logger
 
 from laderr_engine.laderr_lib.services.specification import SpecificationHandler
 
 
-def generate_test_cases_from_folder(folder_path: str):
+@functools.lru_cache(maxsize=None)
+def generate_test_cases_from_folder(folder_path: str) -> tuple[str, ...]:
     """
-    Generator that yields file paths for all TOML files in the specified folder.
+    Collects the file paths of all TOML files in the specified folder.
 
     :param folder_path: Path to the folder containing TOML files.
     :type folder_path: str
-    :yield: Paths to individual TOML files.
-    :rtype: Iterator[str]
+    :return: Paths to individual TOML files.
+    :rtype: tuple[str, ...]
     """
-    for file_name in os.listdir(folder_path):
-        if file_name.endswith(".toml"):
-            yield os.path.join(folder_path, file_name)
+    with os.scandir(folder_path) as entries:
+        return tuple(os.path.join(folder_path, entry.name) for entry in entries if entry.name.endswith(".toml"))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def temp_toml_file():
     """
     Provides a temporary TOML file that can be written to.
-    Ensures cleanup after test.
+    The same file is shared by all tests in this module, each of which overwrites it. Ensures cleanup after the module.
     """
-    with tempfile.NamedTemporaryFile(delete=False, suffix=".toml", mode="w") as temp_file:
-        yield temp_file.name
+    file_descriptor, file_path = tempfile.mkstemp(suffix=".toml")
+    os.close(file_descriptor)
+    yield file_path
+    os.unlink(file_path)
 
 
 @pytest.mark.parametrize("toml_content, expected_metadata_defaults", [  # Existing cases remain unchanged
@@ -56,7 +60,7 @@ def test_metadata_defaults(temp_toml_file, toml_content, expected_metadata_defau
     Tests that metadata defaults (including validation of baseURI) are correctly applied by read_specification.
     """
     with open(temp_toml_file, "w", encoding="utf-8") as f:
-        f.write(dict_to_toml_str(toml_content))
+        f.write(tomli_w.dumps(toml_content))
 
     metadata, _ = SpecificationHandler.read_specification(temp_toml_file)
 
@@ -78,13 +82,10 @@ def test_construct_defaults(temp_toml_file, construct_type, instance_key, initia
     Tests that defaults for constructs (id, label, state) are correctly applied by read_specification.
     """
 
-    # Flattened representation - the parser expects this format:
-    section_key = f"{construct_type}.{instance_key}"
-
-    toml_content = {section_key: initial_properties}
+    toml_content = {construct_type: {instance_key: initial_properties}}
 
     with open(temp_toml_file, "w", encoding="utf-8") as f:
-        f.write(dict_to_toml_str(toml_content))
+        f.write(tomli_w.dumps(toml_content))
 
     _, data = SpecificationHandler.read_specification(temp_toml_file)
 
@@ -100,7 +101,7 @@ def test_created_by_normalization(temp_toml_file, created_by_value, expected_nor
     toml_content = {"createdBy": created_by_value}
 
     with open(temp_toml_file, "w", encoding="utf-8") as f:
-        f.write(dict_to_toml_str(toml_content))
+        f.write(tomli_w.dumps(toml_content))
 
     metadata, _ = SpecificationHandler.read_specification(temp_toml_file)
 
@@ -126,23 +127,6 @@ def test_validate_syntax_errors(file_path: str) -> None:
     pytest.fail(f"No TOMLDecodeError was raised for file: {file_path}")
 
 
-def dict_to_toml_str(d: dict, indent_level=0) -> str:
-    toml_str = ""
-    indent = "    " * indent_level
-    for key, value in d.items():
-        if isinstance(value, dict):
-            toml_str += f"{indent}[{key}]\n"
-            toml_str += dict_to_toml_str(value, indent_level + 0)
-        elif isinstance(value, list):
-            list_str = ", ".join(f'"{v}"' if isinstance(v, str) else str(v) for v in value)
-            toml_str += f"{indent}{key} = [{list_str}]\n"
-        elif isinstance(value, str):
-            toml_str += f'{indent}{key} = "{value}"\n'
-        else:
-            toml_str += f"{indent}{key} = {value}\n"
-    return toml_str
-
-
 @pytest.fixture
 def loguru_caplog(caplog):
     """ Redirect Loguru logs into `caplog`, so pytest can capture them. """
@@ -164,10 +148,10 @@ def test_id_conflict_warning(temp_toml_file, loguru_caplog, construct_type, sect
     """
     loguru_caplog.clear()
 
-    toml_content = {f"{construct_type}.{section_key}": {"id": provided_id}}
+    toml_content = {construct_type: {section_key: {"id": provided_id}}}
 
     with open(temp_toml_file, "w", encoding="utf-8") as f:
-        f.write(dict_to_toml_str(toml_content))
+        f.write(tomli_w.dumps(toml_content))
 
     SpecificationHandler.read_specification(temp_toml_file)
 
@@ -182,10 +166,10 @@ def test_no_unnecessary_defaults(temp_toml_file):
     Tests that fully defined constructs are not modified by _apply_defaults.
     """
     toml_content = {
-        "Capability.flood_control": {"id": "flood_control", "label": "Flood Control System", "state": "disabled"}}
+        "Capability": {"flood_control": {"id": "flood_control", "label": "Flood Control System", "state": "disabled"}}}
 
     with open(temp_toml_file, "w", encoding="utf-8") as f:
-        f.write(dict_to_toml_str(toml_content))
+        f.write(tomli_w.dumps(toml_content))
 
     _, data = SpecificationHandler.read_specification(temp_toml_file)
 
@@ -210,10 +194,10 @@ def test_unrecognized_constructs_are_preserved(temp_toml_file):
     """
     Tests that unrecognized constructs are preserved in the parsed result.
     """
-    toml_content = {"UnknownType.strange": {"someField": "someValue"}}
+    toml_content = {"UnknownType": {"strange": {"someField": "someValue"}}}
 
     with open(temp_toml_file, "w", encoding="utf-8") as f:
-        f.write(dict_to_toml_str(toml_content))
+        f.write(tomli_w.dumps(toml_content))
 
     _, data = SpecificationHandler.read_specification(temp_toml_file)
 
@@ -232,7 +216,7 @@ def test_invalid_base_uri_warning(temp_toml_file, loguru_caplog, invalid_base_ur
     toml_content = {"baseURI": invalid_base_uri}
 
     with open(temp_toml_file, "w", encoding="utf-8") as f:
-        f.write(dict_to_toml_str(toml_content))
+        f.write(tomli_w.dumps(toml_content))
 
     SpecificationHandler.read_specification(temp_toml_file)
 
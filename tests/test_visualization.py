@@ -0,0 +1,194 @@
+import os
+import threading
+import time
+
+import pytest
+from rdflib import Graph, Literal, Namespace, RDF, RDFS
+
+from laderr_engine.laderr_lib.services import visualization
+from laderr_engine.laderr_lib.services.graph import GraphHandler
+from laderr_engine.laderr_lib.services.visualization import VisualizationCreator
+from tests.utils import LADERR
+
+# Scenario identifiers are the part of the URI after the '#', so the test resources use a hash namespace.
+SPEC = Namespace("https://example.org/spec#")
+
+
+def build_graph(*scenario_names: str) -> Graph:
+    """
+    Builds a graph with one scenario per given name, each with an entity and one of its capabilities.
+    """
+    graph = Graph()
+    for name in scenario_names:
+        scenario, entity, capability = SPEC[name], SPEC[f"{name}_entity"], SPEC[f"{name}_capability"]
+        graph.add((scenario, RDF.type, LADERR.Scenario))
+        graph.add((scenario, RDFS.label, Literal(name)))
+        graph.add((entity, RDF.type, LADERR.Entity))
+        graph.add((entity, RDF.type, LADERR.Asset))
+        graph.add((entity, RDFS.label, Literal(f"{name} entity")))
+        graph.add((capability, RDF.type, LADERR.Capability))
+        graph.add((capability, RDFS.label, Literal(f"{name} capability")))
+        graph.add((entity, LADERR.capabilities, capability))
+        for component in (entity, capability):
+            graph.add((scenario, LADERR.components, component))
+    return graph
+
+
+class FakeRender:
+    """
+    Replaces graphviz.render, which requires the Graphviz binary. The rendered file holds the DOT source it was
+    rendered from, and every call is recorded.
+    """
+
+    def __init__(self, delays: dict[str, float] = None):
+        self.calls = []
+        self.delays = delays or {}
+        self.lock = threading.Lock()
+
+    def __call__(self, engine: str, output_format: str, filepath: str) -> str:
+        with open(filepath, encoding="utf-8") as source_file:
+            source = source_file.read()
+        time.sleep(next((delay for name, delay in self.delays.items() if filepath.endswith(f"_{name}")), 0))
+
+        rendered_path = f"{filepath}.{output_format}"
+        with open(rendered_path, "w", encoding="utf-8") as rendered_file:
+            rendered_file.write(source)
+        with self.lock:
+            self.calls.append((os.path.basename(filepath), engine, output_format, source))
+        return rendered_path
+
+
+@pytest.fixture
+def fake_render(monkeypatch):
+    """
+    Provides a FakeRender installed in place of graphviz.render.
+    """
+    render = FakeRender()
+    monkeypatch.setattr(visualization.graphviz, "render", render)
+    return render
+
+
+def scenario_order(graph: Graph) -> list[str]:
+    """
+    Returns the scenario identifiers of the graph, in the order in which they are visualized.
+    """
+    return list(GraphHandler._split_graph_by_scenario(graph))
+
+
+def test_cache_disabled_by_default(fake_render, tmp_path):
+    """
+    Tests that every call renders all scenarios when no cache directory is given.
+    """
+    graph = build_graph("scenario1", "scenario2")
+    base_output_path = str(tmp_path / "viz")
+
+    VisualizationCreator.create_graph_visualization(graph, base_output_path)
+    VisualizationCreator.create_graph_visualization(graph, base_output_path)
+
+    assert len(fake_render.calls) == 4
+
+
+def test_cache_hit_reuses_rendering(fake_render, tmp_path):
+    """
+    Tests that unchanged scenarios are copied from the cache, including into output directories that do not exist yet.
+    """
+    graph = build_graph("scenario1", "scenario2")
+    cache_dir = str(tmp_path / "cache")
+
+    first_paths = VisualizationCreator.create_graph_visualization(graph, str(tmp_path / "first" / "viz"),
+                                                                  cache_dir=cache_dir)
+    second_paths = VisualizationCreator.create_graph_visualization(graph, str(tmp_path / "second" / "viz"),
+                                                                   cache_dir=cache_dir)
+
+    assert len(fake_render.calls) == 2
+    assert [os.path.basename(path) for path in second_paths] == [os.path.basename(path) for path in first_paths]
+    for first_path, second_path in zip(first_paths, second_paths):
+        with open(first_path, encoding="utf-8") as first_file, open(second_path, encoding="utf-8") as second_file:
+            assert first_file.read() == second_file.read()
+    assert not [name for name in os.listdir(cache_dir) if name.endswith(".tmp")]
+
+
+def test_cache_invalidated_by_changed_scenario(fake_render, tmp_path):
+    """
+    Tests that only changed scenarios are rendered again, and that the paths are returned in scenario order.
+    """
+    graph = build_graph("scenario1", "scenario2")
+    base_output_path = str(tmp_path / "viz")
+    cache_dir = str(tmp_path / "cache")
+    VisualizationCreator.create_graph_visualization(graph, base_output_path, cache_dir=cache_dir)
+    fake_render.calls.clear()
+
+    # The first scenario changes, so it is rendered while the second one is copied from the cache
+    changed_scenario = scenario_order(graph)[0]
+    graph.set((SPEC[f"{changed_scenario}_entity"], RDFS.label, Literal("renamed entity")))
+    rendered_paths = VisualizationCreator.create_graph_visualization(graph, base_output_path, cache_dir=cache_dir)
+
+    assert [call[0] for call in fake_render.calls] == [f"viz_{changed_scenario}"]
+    assert rendered_paths == [f"{base_output_path}_{scenario_id}.png" for scenario_id in scenario_order(graph)]
+
+
+@pytest.mark.parametrize("options", [{"output_format": "svg"}, {"draft": True}, {"engine": "neato"}],
+                         ids=["output_format", "draft", "engine"])
+def test_cache_keyed_by_rendering_options(fake_render, tmp_path, options):
+    """
+    Tests that a rendering cached with the default options is not reused when a rendering option changes.
+    """
+    graph = build_graph("scenario1")
+    base_output_path = str(tmp_path / "viz")
+    cache_dir = str(tmp_path / "cache")
+
+    VisualizationCreator.create_graph_visualization(graph, base_output_path, cache_dir=cache_dir)
+    VisualizationCreator.create_graph_visualization(graph, base_output_path, cache_dir=cache_dir, **options)
+
+    assert len(fake_render.calls) == 2
+
+
+def test_cache_keyed_by_renderer_version(fake_render, tmp_path, monkeypatch):
+    """
+    Tests that renderings cached by a previous renderer version are not reused.
+    """
+    graph = build_graph("scenario1")
+    base_output_path = str(tmp_path / "viz")
+    cache_dir = str(tmp_path / "cache")
+
+    VisualizationCreator.create_graph_visualization(graph, base_output_path, cache_dir=cache_dir)
+    monkeypatch.setattr(visualization, "_RENDERER_VERSION", visualization._RENDERER_VERSION + ".test")
+    VisualizationCreator.create_graph_visualization(graph, base_output_path, cache_dir=cache_dir)
+
+    assert len(fake_render.calls) == 2
+
+
+@pytest.mark.parametrize("options, engine, output_format, dpi", [
+    ({}, "dot", "png", "300"),
+    ({"output_format": "svg"}, "dot", "svg", "300"),
+    ({"draft": True}, "dot", "png", "96"),
+    ({"engine": "neato"}, "neato", "png", "300"),
+], ids=["defaults", "output_format", "draft", "engine"])
+def test_rendering_options(fake_render, tmp_path, options, engine, output_format, dpi):
+    """
+    Tests that the layout engine, output format and resolution are passed on to Graphviz.
+    """
+    graph = build_graph("scenario1")
+    base_output_path = str(tmp_path / "viz")
+
+    rendered_paths = VisualizationCreator.create_graph_visualization(graph, base_output_path, **options)
+
+    assert rendered_paths == [f"{base_output_path}_scenario1.{output_format}"]
+    (_, call_engine, call_format, source), = fake_render.calls
+    assert (call_engine, call_format) == (engine, output_format)
+    assert f"dpi={dpi}" in source
+
+
+def test_concurrent_renders_returned_in_scenario_order(fake_render, tmp_path):
+    """
+    Tests that the rendered paths follow the scenario order even when later scenarios finish rendering first.
+    """
+    graph = build_graph("scenario1", "scenario2", "scenario3")
+    base_output_path = str(tmp_path / "viz")
+    expected_order = scenario_order(graph)
+    fake_render.delays = {expected_order[0]: 0.2, expected_order[1]: 0.1}
+
+    rendered_paths = VisualizationCreator.create_graph_visualization(graph, base_output_path)
+
+    assert [call[0] for call in fake_render.calls] == [f"viz_{scenario_id}" for scenario_id in reversed(expected_order)]
+    assert rendered_paths == [f"{base_output_path}_{scenario_id}.png" for scenario_id in expected_order]
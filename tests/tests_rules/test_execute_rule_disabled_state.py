@@ -1,14 +1,18 @@
 import pytest
 from owlrl import DeductiveClosure, RDFS_Semantics
-from rdflib import Graph, Namespace, URIRef, RDF
+from rdflib import Graph, URIRef, RDF, RDFS
 
 from laderr_engine.laderr_lib.services.graph import GraphHandler
-from tests.utils import EXAMPLE
-
-LADERR = Namespace("https://w3id.org/laderr#")
+from tests.utils import EXAMPLE, LADERR
 
 from laderr_engine.laderr_lib.services.inference_rules import InferenceRules  # Adjust if needed
 
+# State patterns checked after the rule runs, built once for all cases
+D1_ENABLED = (EXAMPLE.disposition1, LADERR.state, LADERR.enabled)
+D1_DISABLED = (EXAMPLE.disposition1, LADERR.state, LADERR.disabled)
+D2_ENABLED = (EXAMPLE.disposition2, LADERR.state, LADERR.enabled)
+D2_DISABLED = (EXAMPLE.disposition2, LADERR.state, LADERR.disabled)
+
 
 @pytest.fixture
 def laderr_graph_with_disabling_relation():
@@ -23,15 +27,29 @@ def laderr_graph_with_disabling_relation():
     disposition1 = EXAMPLE.disposition1
     disposition2 = EXAMPLE.disposition2
 
-    g.add((disposition1, RDF.type, LADERR.Disposition))
-    g.add((disposition2, RDF.type, LADERR.Disposition))
+    g.addN((s, p, o, g) for s, p, o in (
+        (disposition1, RDF.type, LADERR.Disposition),
+        (disposition2, RDF.type, LADERR.Disposition),
+        (disposition1, LADERR.state, LADERR.disabled),  # d1 starts as disabled
+        (disposition2, LADERR.state, LADERR.enabled),  # d2 starts as enabled
+        (disposition1, LADERR.disables, disposition2),
+    ))
 
-    g.add((disposition1, LADERR.state, LADERR.disabled))  # d1 starts as disabled
-    g.add((disposition2, LADERR.state, LADERR.enabled))  # d2 starts as enabled
+    return g, disposition1, disposition2
 
-    g.add((disposition1, LADERR.disables, disposition2))
 
-    return g, disposition1, disposition2
+@pytest.fixture(scope="module")
+def laderr_schema_closure():
+    """
+    Computes the RDFS closure of the LaDeRR vocabulary once for all cases of this module.
+
+    :return: Triples of the expanded vocabulary.
+    :rtype: tuple
+    """
+    g = Graph()
+    g.addN((s, p, o, g) for s, p, o in GraphHandler._get_laderr_schema_triples())
+    DeductiveClosure(RDFS_Semantics).expand(g)
+    return tuple(g)
 
 
 @pytest.mark.parametrize("type1, type2", [
@@ -47,7 +65,8 @@ def laderr_graph_with_disabling_relation():
     (LADERR.enabled, LADERR.disabled),
     (LADERR.disabled, LADERR.disabled),
 ])
-def test_execute_rule_disabled_state_various_states(type1: URIRef, type2: URIRef, state_d1: URIRef, state_d2: URIRef):
+def test_execute_rule_disabled_state_various_states(laderr_schema_closure, type1: URIRef, type2: URIRef,
+                                                    state_d1: URIRef, state_d2: URIRef):
     """
     Tests the rule under different initial states of dispositions and different types.
 
@@ -56,34 +75,42 @@ def test_execute_rule_disabled_state_various_states(type1: URIRef, type2: URIRef
     :param state_d1: Initial state of disposition1.
     :param state_d2: Initial state of disposition2.
     """
-    g = GraphHandler._load_laderr_schema()
+    # The vocabulary closure is computed once per module; each case only copies its triples into a fresh graph
+    g = Graph()
+    g.addN((s, p, o, g) for s, p, o in laderr_schema_closure)
 
     disposition1 = EXAMPLE.disposition1
     disposition2 = EXAMPLE.disposition2
 
-    g.add((disposition1, RDF.type, type1))
-    g.add((disposition2, RDF.type, type2))
-    g.add((disposition1, LADERR.state, state_d1))
-    g.add((disposition2, LADERR.state, state_d2))
-    g.add((disposition1, LADERR.disables, disposition2))
+    g.addN((s, p, o, g) for s, p, o in (
+        (disposition1, RDF.type, type1),
+        (disposition2, RDF.type, type2),
+        (disposition1, LADERR.state, state_d1),
+        (disposition2, LADERR.state, state_d2),
+        (disposition1, LADERR.disables, disposition2),
+    ))
+
+    # Delta closure: the rule only reads instance types, so only the superclasses of the asserted types are added
+    for disposition, disposition_type in ((disposition1, type1), (disposition2, type2)):
+        g.addN((disposition, RDF.type, superclass, g)
+               for superclass in g.transitive_objects(disposition_type, RDFS.subClassOf))
 
-    DeductiveClosure(RDFS_Semantics).expand(g)
     InferenceRules.execute_rule_disposition_state(g)
 
     # Ensure the expected state of d1 is present
-    assert (disposition1, LADERR.state, LADERR.enabled) in g, \
+    assert D1_ENABLED in g, \
         f"Disposition1 should be in state LADERR.enabled, but it is not."
 
     # Ensure the incorrect state of d1 is NOT in the graph
-    assert not (disposition1, LADERR.state, LADERR.disabled) in g, \
+    assert D1_DISABLED not in g, \
         f"Incorrect state of disposition1 ({state_d1}) should not be in the graph."
 
     # Ensure the expected state of d2 is present
-    assert (disposition2, LADERR.state, LADERR.disabled) in g, \
+    assert D2_DISABLED in g, \
         f"Disposition2 should be in state LADERR.disabled, but it is not."
 
     # Ensure the incorrect state of d2 is NOT in the graph
-    assert not (disposition2, LADERR.state, LADERR.enabled) in g, \
+    assert D2_ENABLED not in g, \
         f"Incorrect state of disposition1 ({state_d2}) should not be in the graph."
 
 
@@ -103,9 +130,9 @@ def test_execute_rule_with_missing_states():
 
     InferenceRules.execute_rule_disposition_state(g)
 
-    assert (disposition1, LADERR.state, LADERR.enabled) in g, \
+    assert D1_ENABLED in g, \
         "Disposition1 should be inferred as enabled."
-    assert (disposition2, LADERR.state, LADERR.disabled) in g, \
+    assert D2_DISABLED in g, \
         "Disposition2 should be inferred as disabled."
 
 
@@ -124,9 +151,8 @@ def test_execute_rule_disabled_state_no_dispositions(empty_laderr_graph):
     """
     Ensures that execute_rule_disabled_state does nothing if no Dispositions exist in the graph.
     """
-    initial_triples = set(empty_laderr_graph)  # Capture initial state of the graph
-
     InferenceRules.execute_rule_disposition_state(empty_laderr_graph)
 
-    assert set(empty_laderr_graph) == initial_triples, \
+    # The fixture graph starts empty, so remaining empty is equivalent to remaining unchanged
+    assert len(empty_laderr_graph) == 0, \
         "Graph should remain unchanged when no dispositions exist."
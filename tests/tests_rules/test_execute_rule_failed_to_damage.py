@@ -1,10 +1,8 @@
 import pytest
-from rdflib import Graph, Namespace, RDF
+from rdflib import Graph, RDF
 
 from laderr_engine.laderr_lib.services.inference_rules import InferenceRules  # Adjust if needed
-from tests.utils import EXAMPLE
-
-LADERR = Namespace("https://w3id.org/laderr#")
+from tests.utils import EXAMPLE, LADERR
 
 
 @pytest.fixture
@@ -23,20 +21,19 @@ def laderr_graph_with_valid_failed_to_damage_case():
     vulnerability1 = EXAMPLE.vulnerability1
 
     # Define entities
-    g.add((entity1, RDF.type, LADERR.Entity))
-    g.add((entity2, RDF.type, LADERR.Entity))
-
-    # Define capabilities & vulnerabilities
-    g.add((entity1, LADERR.capabilities, capability1))
-    g.add((entity1, LADERR.vulnerabilities, vulnerability1))
-    g.add((vulnerability1, LADERR.exposes, capability1))  # v1 exposes c1
-
-    g.add((entity2, LADERR.capabilities, capability2))
-    g.add((capability2, LADERR.exploits, vulnerability1))  # c2 exploits v1
-
-    # Define states
-    g.add((capability2, LADERR.state, LADERR.enabled))  # Attacking capability enabled
-    g.add((vulnerability1, LADERR.state, LADERR.disabled))  # Vulnerability disabled
+    g.addN((s, p, o, g) for s, p, o in (
+        (entity1, RDF.type, LADERR.Entity),
+        (entity2, RDF.type, LADERR.Entity),
+        # Define capabilities & vulnerabilities
+        (entity1, LADERR.capabilities, capability1),
+        (entity1, LADERR.vulnerabilities, vulnerability1),
+        (vulnerability1, LADERR.exposes, capability1),  # v1 exposes c1
+        (entity2, LADERR.capabilities, capability2),
+        (capability2, LADERR.exploits, vulnerability1),  # c2 exploits v1
+        # Define states
+        (capability2, LADERR.state, LADERR.enabled),  # Attacking capability enabled
+        (vulnerability1, LADERR.state, LADERR.disabled),  # Vulnerability disabled
+    ))
 
     return g, entity1, entity2
 
@@ -103,7 +100,7 @@ def test_failed_to_damage_not_inferred_if_already_exists(laderr_graph_with_valid
 
     InferenceRules.execute_rule_entity_damage_negative(g)
 
-    assert len(list(g.triples((entity2, LADERR.failedToDamage, entity1)))) == 1, \
+    assert sum(1 for _ in g.triples((entity2, LADERR.failedToDamage, entity1))) == 1, \
         "failedToDamage should not be duplicated."
 
 
@@ -137,16 +134,17 @@ def test_failed_to_damage_not_inferred_with_only_one_entity():
     vulnerability1 = EXAMPLE.vulnerability1
 
     # Define a single entity with capability & vulnerability
-    g.add((entity1, RDF.type, LADERR.Entity))
-    g.add((entity1, LADERR.capabilities, capability1))
-    g.add((entity1, LADERR.vulnerabilities, vulnerability1))
-    g.add((vulnerability1, LADERR.exposes, capability1))
-
-    # Define states
-    g.add((vulnerability1, LADERR.state, LADERR.disabled))
-    g.add((capability1, LADERR.state, LADERR.enabled))
+    g.addN((s, p, o, g) for s, p, o in (
+        (entity1, RDF.type, LADERR.Entity),
+        (entity1, LADERR.capabilities, capability1),
+        (entity1, LADERR.vulnerabilities, vulnerability1),
+        (vulnerability1, LADERR.exposes, capability1),
+        # Define states
+        (vulnerability1, LADERR.state, LADERR.disabled),
+        (capability1, LADERR.state, LADERR.enabled),
+    ))
 
     InferenceRules.execute_rule_entity_damage_negative(g)
 
-    assert len(list(g.subjects(RDF.type, LADERR.failedToDamage))) == 0, \
+    assert (None, RDF.type, LADERR.failedToDamage) not in g, \
         "failedToDamage should not be inferred with only one entity."
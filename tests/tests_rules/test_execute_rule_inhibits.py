@@ -1,9 +1,7 @@
 import pytest
-from rdflib import Graph, Namespace, RDF
+from rdflib import Graph, RDF
 
-from tests.utils import EXAMPLE
-
-LADERR = Namespace("https://w3id.org/laderr#")
+from tests.utils import EXAMPLE, LADERR
 
 from laderr_engine.laderr_lib.services.inference_rules import InferenceRules  # Adjust if needed
 
@@ -32,19 +30,19 @@ def laderr_graph_with_inhibiting_capability():
     vulnerability1 = EXAMPLE.vulnerability1
 
     # Assign types
-    g.add((entity1, RDF.type, LADERR.Entity))
-    g.add((entity2, RDF.type, LADERR.Entity))
-    g.add((capability1, RDF.type, LADERR.Capability))
-    g.add((capability2, RDF.type, LADERR.Capability))
-    g.add((vulnerability1, RDF.type, LADERR.Vulnerability))
-
-    # Set up capability ownership
-    g.add((entity1, LADERR.capabilities, capability1))
-    g.add((entity2, LADERR.capabilities, capability2))
-
-    # Capability relationships
-    g.add((capability1, LADERR.disables, vulnerability1))
-    g.add((capability2, LADERR.exploits, vulnerability1))
+    g.addN((s, p, o, g) for s, p, o in (
+        (entity1, RDF.type, LADERR.Entity),
+        (entity2, RDF.type, LADERR.Entity),
+        (capability1, RDF.type, LADERR.Capability),
+        (capability2, RDF.type, LADERR.Capability),
+        (vulnerability1, RDF.type, LADERR.Vulnerability),
+        # Set up capability ownership
+        (entity1, LADERR.capabilities, capability1),
+        (entity2, LADERR.capabilities, capability2),
+        # Capability relationships
+        (capability1, LADERR.disables, vulnerability1),
+        (capability2, LADERR.exploits, vulnerability1),
+    ))
 
     return g, entity1, entity2
 
@@ -66,7 +64,8 @@ def test_execute_rule_inhibits(laderr_graph_with_inhibiting_capability):
                                                         (False, True),  # No disables, Yes exploits
                                                         (True, False),  # Yes disables, No exploits
                                                         ])
-def test_no_inhibits_inferred_when_conditions_not_met(add_disables, add_exploits):
+def test_no_inhibits_inferred_when_conditions_not_met(laderr_graph_with_inhibiting_capability, add_disables,
+                                                      add_exploits):
     """
     Tests that no inhibition is inferred when conditions are not fully met.
     Cases:
@@ -74,31 +73,13 @@ def test_no_inhibits_inferred_when_conditions_not_met(add_disables, add_exploits
     2. No disables and Yes exploits
     3. Yes disables and No exploits
     """
+    g, entity1, entity2 = laderr_graph_with_inhibiting_capability
 
-    g = Graph()
-
-    entity1 = EXAMPLE.entity1
-    entity2 = EXAMPLE.entity2
-    capability1 = EXAMPLE.capability1
-    capability2 = EXAMPLE.capability2
-    vulnerability1 = EXAMPLE.vulnerability1
-
-    # Assign types
-    g.add((entity1, RDF.type, LADERR.Entity))
-    g.add((entity2, RDF.type, LADERR.Entity))
-    g.add((capability1, RDF.type, LADERR.Capability))
-    g.add((capability2, RDF.type, LADERR.Capability))
-    g.add((vulnerability1, RDF.type, LADERR.Vulnerability))
-
-    # Set up capabilities
-    g.add((entity1, LADERR.capabilities, capability1))
-    g.add((entity2, LADERR.capabilities, capability2))
-
-    # Conditional relationships
-    if add_disables:
-        g.add((capability1, LADERR.disables, vulnerability1))
-    if add_exploits:
-        g.add((capability2, LADERR.exploits, vulnerability1))
+    # Conditional relationships: the fixture states both, so the missing ones are removed
+    if not add_disables:
+        g.remove((EXAMPLE.capability1, LADERR.disables, EXAMPLE.vulnerability1))
+    if not add_exploits:
+        g.remove((EXAMPLE.capability2, LADERR.exploits, EXAMPLE.vulnerability1))
 
     # Execute inference rule
     InferenceRules.execute_rule_entity_inhibits(g)
@@ -108,32 +89,11 @@ def test_no_inhibits_inferred_when_conditions_not_met(add_disables, add_exploits
             entity2) not in g, f"Inhibits relationship was incorrectly inferred for disables={add_disables}, exploits={add_exploits}."
 
 
-def test_inhibits_already_exists():
+def test_inhibits_already_exists(laderr_graph_with_inhibiting_capability):
     """
     Tests that the inference rule does not duplicate existing inhibits relationships.
     """
-    g = Graph()
-
-    entity1 = EXAMPLE.entity1
-    entity2 = EXAMPLE.entity2
-    capability1 = EXAMPLE.capability1
-    capability2 = EXAMPLE.capability2
-    vulnerability1 = EXAMPLE.vulnerability1
-
-    # Assign types
-    g.add((entity1, RDF.type, LADERR.Entity))
-    g.add((entity2, RDF.type, LADERR.Entity))
-    g.add((capability1, RDF.type, LADERR.Capability))
-    g.add((capability2, RDF.type, LADERR.Capability))
-    g.add((vulnerability1, RDF.type, LADERR.Vulnerability))
-
-    # Set up capabilities
-    g.add((entity1, LADERR.capabilities, capability1))
-    g.add((entity2, LADERR.capabilities, capability2))
-
-    # Capability relationships
-    g.add((capability1, LADERR.disables, vulnerability1))
-    g.add((capability2, LADERR.exploits, vulnerability1))
+    g, entity1, entity2 = laderr_graph_with_inhibiting_capability
 
     # Manually state the inhibits relation
     g.add((entity1, LADERR.inhibits, entity2))
@@ -141,8 +101,8 @@ def test_inhibits_already_exists():
     InferenceRules.execute_rule_entity_inhibits(g)
 
     # Ensure there is only ONE inhibits relationship (not duplicated)
-    assert len(
-        list(g.triples((entity1, LADERR.inhibits, entity2)))) == 1, "inhibits relationship should not be duplicated."
+    assert sum(1 for _ in g.triples((entity1, LADERR.inhibits, entity2))) == 1, \
+        "inhibits relationship should not be duplicated."
 
 
 def test_self_inhibition_not_inferred():
@@ -156,16 +116,16 @@ def test_self_inhibition_not_inferred():
     vulnerability1 = EXAMPLE.vulnerability1
 
     # Assign types
-    g.add((entity1, RDF.type, LADERR.Entity))
-    g.add((capability1, RDF.type, LADERR.Capability))
-    g.add((vulnerability1, RDF.type, LADERR.Vulnerability))
-
-    # Set up capability
-    g.add((entity1, LADERR.capabilities, capability1))
-
-    # Capability relationships (self-inhibiting case)
-    g.add((capability1, LADERR.disables, vulnerability1))
-    g.add((capability1, LADERR.exploits, vulnerability1))  # Exploiting the same vulnerability
+    g.addN((s, p, o, g) for s, p, o in (
+        (entity1, RDF.type, LADERR.Entity),
+        (capability1, RDF.type, LADERR.Capability),
+        (vulnerability1, RDF.type, LADERR.Vulnerability),
+        # Set up capability
+        (entity1, LADERR.capabilities, capability1),
+        # Capability relationships (self-inhibiting case)
+        (capability1, LADERR.disables, vulnerability1),
+        (capability1, LADERR.exploits, vulnerability1),  # Exploiting the same vulnerability
+    ))
 
     InferenceRules.execute_rule_entity_inhibits(g)
 
@@ -1,9 +1,7 @@
 import pytest
-from rdflib import Graph, Namespace
+from rdflib import Graph
 
-from tests.utils import EXAMPLE
-
-LADERR = Namespace("https://w3id.org/laderr#")
+from tests.utils import EXAMPLE, LADERR
 
 from laderr_engine.laderr_lib.services.inference_rules import InferenceRules  # Adjust if needed
 
@@ -62,14 +60,15 @@ def test_protects_already_exists():
     capability = EXAMPLE.capability1
     vulnerability = EXAMPLE.vulnerability1
 
-    g.add((entity1, LADERR.capabilities, capability))
-    g.add((entity2, LADERR.vulnerabilities, vulnerability))
-    g.add((capability, LADERR.disables, vulnerability))
-
-    # Manually state the protects relation
-    g.add((entity1, LADERR.protects, entity2))
+    g.addN((s, p, o, g) for s, p, o in (
+        (entity1, LADERR.capabilities, capability),
+        (entity2, LADERR.vulnerabilities, vulnerability),
+        (capability, LADERR.disables, vulnerability),
+        # Manually state the protects relation
+        (entity1, LADERR.protects, entity2),
+    ))
 
     InferenceRules.execute_rule_entity_protects(g)
 
-    assert len(list(g.triples((entity1, LADERR.protects, entity2)))) == 1, \
+    assert sum(1 for _ in g.triples((entity1, LADERR.protects, entity2))) == 1, \
         "protects relationship should not be duplicated."
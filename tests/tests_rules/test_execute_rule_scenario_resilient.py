@@ -1,12 +1,12 @@
 import pytest
-from rdflib import Graph, Namespace, RDF
+from rdflib import Graph, RDF
 
-from tests.utils import EXAMPLE
-
-LADERR = Namespace("https://w3id.org/laderr#")
+from tests.utils import EXAMPLE, LADERR
 
 from laderr_engine.laderr_lib.services.inference_rules import InferenceRules  # Adjust if needed
 
+VULNERABILITY_STATES = {"enabled": LADERR.enabled, "disabled": LADERR.disabled, "exploited": LADERR.enabled}
+
 
 @pytest.fixture
 def laderr_graph_with_incident_scenario():
@@ -27,18 +27,18 @@ def laderr_graph_with_incident_scenario():
     vulnerability2 = EXAMPLE.vulnerability2
 
     # Specification setup
-    g.add((spec, RDF.type, LADERR.Specification))
-    g.add((spec, LADERR.scenario, LADERR.incident))
-    g.add((spec, LADERR.constructs, entity1))
-    g.add((spec, LADERR.constructs, entity2))
-
-    # Entity 1 setup
-    g.add((entity1, LADERR.capabilities, capability1))
-    g.add((entity1, LADERR.vulnerabilities, vulnerability1))
-
-    # Entity 2 setup
-    g.add((entity2, LADERR.capabilities, capability2))
-    g.add((entity2, LADERR.vulnerabilities, vulnerability2))
+    g.addN((s, p, o, g) for s, p, o in (
+        (spec, RDF.type, LADERR.Specification),
+        (spec, LADERR.scenario, LADERR.incident),
+        (spec, LADERR.constructs, entity1),
+        (spec, LADERR.constructs, entity2),
+        # Entity 1 setup
+        (entity1, LADERR.capabilities, capability1),
+        (entity1, LADERR.vulnerabilities, vulnerability1),
+        # Entity 2 setup
+        (entity2, LADERR.capabilities, capability2),
+        (entity2, LADERR.vulnerabilities, vulnerability2),
+    ))
 
     return g, spec, entity1, entity2, capability1, capability2, vulnerability1, vulnerability2
 
@@ -66,12 +66,13 @@ def test_scenario_resilient_inferred_when_all_vulnerabilities_exploited(laderr_g
     g, spec, entity1, entity2, capability1, capability2, vulnerability1, vulnerability2 = laderr_graph_with_incident_scenario
 
     # Ensure vulnerabilities are enabled
-    g.add((vulnerability1, LADERR.state, LADERR.enabled))
-    g.add((vulnerability2, LADERR.state, LADERR.enabled))
-
-    # Make capabilities exploit vulnerabilities
-    g.add((capability1, LADERR.exploits, vulnerability1))
-    g.add((capability2, LADERR.exploits, vulnerability2))
+    g.addN((s, p, o, g) for s, p, o in (
+        (vulnerability1, LADERR.state, LADERR.enabled),
+        (vulnerability2, LADERR.state, LADERR.enabled),
+        # Make capabilities exploit vulnerabilities
+        (capability1, LADERR.exploits, vulnerability1),
+        (capability2, LADERR.exploits, vulnerability2),
+    ))
 
     InferenceRules.execute_rule_scenario_status(g)
 
@@ -90,17 +91,13 @@ def test_scenario_resilient_various_cases(laderr_graph_with_incident_scenario, v
     """
     g, spec, entity1, entity2, capability1, capability2, vulnerability1, vulnerability2 = laderr_graph_with_incident_scenario
 
-    if vulnerability_state == "enabled":
-        g.add((vulnerability1, LADERR.state, LADERR.enabled))
-        g.add((vulnerability2, LADERR.state, LADERR.enabled))
-    elif vulnerability_state == "disabled":
-        g.add((vulnerability1, LADERR.state, LADERR.disabled))
-        g.add((vulnerability2, LADERR.state, LADERR.disabled))
-    elif vulnerability_state == "exploited":
-        g.add((vulnerability1, LADERR.state, LADERR.enabled))
-        g.add((vulnerability2, LADERR.state, LADERR.enabled))
-        g.add((capability1, LADERR.exploits, vulnerability1))
-        g.add((capability2, LADERR.exploits, vulnerability2))
+    # Exploited vulnerabilities stay enabled; they only gain an exploiting capability each
+    state = VULNERABILITY_STATES[vulnerability_state]
+    triples = [(vulnerability1, LADERR.state, state), (vulnerability2, LADERR.state, state)]
+    if vulnerability_state == "exploited":
+        triples += [(capability1, LADERR.exploits, vulnerability1), (capability2, LADERR.exploits, vulnerability2)]
+
+    g.addN((s, p, o, g) for s, p, o in triples)
 
     InferenceRules.execute_rule_scenario_status(g)
 
@@ -1,9 +1,7 @@
 import pytest
-from rdflib import Graph, Namespace, RDF
+from rdflib import Graph, RDF
 
-from tests.utils import EXAMPLE
-
-LADERR = Namespace("https://w3id.org/laderr#")
+from tests.utils import EXAMPLE, LADERR
 
 from laderr_engine.laderr_lib.services.inference_rules import InferenceRules  # Adjust if needed
 
@@ -22,25 +20,23 @@ def laderr_graph_with_valid_succeeded_to_damage_case():
     vulnerability1 = EXAMPLE.vulnerability1
 
     # Specification setup
-    g.add((spec, RDF.type, LADERR.Specification))
-    g.add((spec, LADERR.scenario, LADERR.incident))
-    g.add((spec, LADERR.constructs, entity1))
-    g.add((spec, LADERR.constructs, entity2))
-
-    # Relationships for entity1
-    g.add((entity1, LADERR.capabilities, capability1))
-    g.add((entity1, LADERR.vulnerabilities, vulnerability1))
-    g.add((vulnerability1, LADERR.exposes, capability1))
-
-    # Relationships for entity2
-    g.add((entity2, LADERR.capabilities, capability2))
-
-    # Exploitation relation
-    g.add((capability2, LADERR.exploits, vulnerability1))
-
-    # States (both enabled)
-    g.add((capability2, LADERR.state, LADERR.enabled))
-    g.add((vulnerability1, LADERR.state, LADERR.enabled))
+    g.addN((s, p, o, g) for s, p, o in (
+        (spec, RDF.type, LADERR.Specification),
+        (spec, LADERR.scenario, LADERR.incident),
+        (spec, LADERR.constructs, entity1),
+        (spec, LADERR.constructs, entity2),
+        # Relationships for entity1
+        (entity1, LADERR.capabilities, capability1),
+        (entity1, LADERR.vulnerabilities, vulnerability1),
+        (vulnerability1, LADERR.exposes, capability1),
+        # Relationships for entity2
+        (entity2, LADERR.capabilities, capability2),
+        # Exploitation relation
+        (capability2, LADERR.exploits, vulnerability1),
+        # States (both enabled)
+        (capability2, LADERR.state, LADERR.enabled),
+        (vulnerability1, LADERR.state, LADERR.enabled),
+    ))
 
     return g, spec, entity1, entity2
 
@@ -141,12 +137,11 @@ def test_succeeded_to_damage_not_inferred_without_necessary_relation(laderr_grap
     """
     g, spec, entity1, entity2 = laderr_graph_with_valid_succeeded_to_damage_case
 
-    if missing_relation == "exploits":
-        g.remove(
-            (EXAMPLE.capability2, LADERR.exploits, EXAMPLE.vulnerability1))
-    elif missing_relation == "exposes":
-        g.remove(
-            (EXAMPLE.vulnerability1, LADERR.exposes, EXAMPLE.capability1))
+    removed_triple = {
+        "exploits": (EXAMPLE.capability2, LADERR.exploits, EXAMPLE.vulnerability1),
+        "exposes": (EXAMPLE.vulnerability1, LADERR.exposes, EXAMPLE.capability1),
+    }[missing_relation]
+    g.remove(removed_triple)
 
     InferenceRules.execute_rule_entity_damage_positive(g)
 
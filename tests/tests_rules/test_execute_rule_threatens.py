@@ -1,9 +1,7 @@
 import pytest
-from rdflib import Graph, Namespace
+from rdflib import Graph
 
-from tests.utils import EXAMPLE
-
-LADERR = Namespace("https://w3id.org/laderr#")
+from tests.utils import EXAMPLE, LADERR
 
 from laderr_engine.laderr_lib.services.inference_rules import InferenceRules  # Adjust if necessary
 
@@ -64,14 +62,15 @@ def test_threatens_already_exists():
     capability = EXAMPLE.capability1
     vulnerability = EXAMPLE.vulnerability1
 
-    g.add((entity1, LADERR.capabilities, capability))
-    g.add((entity2, LADERR.vulnerabilities, vulnerability))
-    g.add((capability, LADERR.exploits, vulnerability))
-
-    # Manually add the threatens relation
-    g.add((entity1, LADERR.threatens, entity2))
+    g.addN((s, p, o, g) for s, p, o in (
+        (entity1, LADERR.capabilities, capability),
+        (entity2, LADERR.vulnerabilities, vulnerability),
+        (capability, LADERR.exploits, vulnerability),
+        # Manually add the threatens relation
+        (entity1, LADERR.threatens, entity2),
+    ))
 
     InferenceRules.execute_rule_entity_threatens(g)
 
-    assert len(list(g.triples((entity1, LADERR.threatens, entity2)))) == 1, \
+    assert sum(1 for _ in g.triples((entity1, LADERR.threatens, entity2))) == 1, \
         "threatens relationship should not be duplicated."
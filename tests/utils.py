@@ -1,11 +1,14 @@
+import functools
 import os
 
 from loguru import logger
 from rdflib import Namespace
 
 EXAMPLE = Namespace("https://example.org/")
+LADERR = Namespace("https://w3id.org/laderr#")
 
 
+@functools.lru_cache(maxsize=256)
 def find_file_by_partial_name(folder_path: str, partial_name: str) -> str:
     """
     Search for a file in the given folder that contains the specified partial name.
@@ -20,9 +23,11 @@ def find_file_by_partial_name(folder_path: str, partial_name: str) -> str:
     if not os.path.isdir(folder_path):
         raise ValueError(f"The folder path '{folder_path}' does not exist or is not a directory.")
 
-    for filename in os.listdir(folder_path):
-        if partial_name in filename:
-            return os.path.join(folder_path, filename)
+    # Folders are not modified during a test run, so results are memoized per (folder, partial name)
+    with os.scandir(folder_path) as entries:
+        for entry in entries:
+            if partial_name in entry.name:
+                return os.path.join(folder_path, entry.name)
 
     # No file found matching the criteria
     logger.warning("No file found matching the criteria.")